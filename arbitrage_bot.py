@@ -4,25 +4,47 @@ XLM Arbitrage Bot for Binance and Kraken
 Monitors price differences and executes arbitrage trades
 """
 
+import asyncio
+import heapq
 import time
 import sys
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 from datetime import datetime
 
+try:
+    import uvloop
+except ImportError:
+    try:
+        import winloop as uvloop  # uvloop is POSIX-only; winloop is its Windows port
+    except ImportError:
+        uvloop = None  # Fall back to the default asyncio loop
+
 from config import Config
-from exchange_client import BinanceClient, KrakenClient, ExchangeClient
+from exchange_client import ExchangeClient, make_client
+from models import Ticker
 from arbitrage_detector import ArbitrageDetector, ArbitrageOpportunity
+from price_feed import WSPriceFeed, create_price_feed
 from logger import setup_logger
 
 
 class ArbitrageBot:
     """Main arbitrage bot orchestrator"""
     
+    # Exchange names as shown in the logs
+    DISPLAY_NAMES = {
+        'binance': "Binance.US",
+        'kraken': "Kraken",
+    }
+    
     def __init__(self):
         self.logger = setup_logger('arbitrage_bot')
         self.config = Config
         self.detector = ArbitrageDetector()
         self.exchanges: Dict[str, ExchangeClient] = {}
+        self.feeds: Dict[str, WSPriceFeed] = {}
+        self._feed_tasks: List[asyncio.Task] = []
+        
         self.running = False
         self.iteration_count = 0
         
@@ -47,6 +69,8 @@ class ArbitrageBot:
         self.logger.info(f"Min Profit: {Config.MIN_PROFIT_PERCENTAGE}%")
         self.logger.info(f"Trade Amount: ${Config.TRADE_AMOUNT_USD}")
         self.logger.info(f"Check Interval: {Config.CHECK_INTERVAL_SECONDS}s")
+        self.logger.info(f"Log Prices Every: {Config.LOG_EVERY} iteration(s)")
+        self.logger.info(f"WebSocket Feeds: {Config.USE_WEBSOCKETS}")
         self.logger.info(f"DRY RUN MODE: {Config.DRY_RUN}")
         
         if Config.DRY_RUN:
@@ -62,17 +86,21 @@ class ArbitrageBot:
         """Initialize connections to exchanges"""
         self.logger.info("\nInitializing exchange connections...")
         
-        try:
-            self.exchanges['binance'] = BinanceClient()
-            self.logger.info("✓ Binance.US connected")
-        except Exception as e:
-            self.logger.error(f"✗ Failed to connect to Binance: {e}")
+        # Each client blocks on its own load_markets() round-trip, so connect
+        # them side by side
+        with ThreadPoolExecutor(max_workers=len(Config.EXCHANGES)) as pool:
+            futures = {
+                exchange_name: pool.submit(make_client, exchange_name)
+                for exchange_name in Config.EXCHANGES
+            }
         
-        try:
-            self.exchanges['kraken'] = KrakenClient()
-            self.logger.info("✓ Kraken connected")
-        except Exception as e:
-            self.logger.error(f"✗ Failed to connect to Kraken: {e}")
+        for exchange_name, future in futures.items():
+            display_name = self.DISPLAY_NAMES.get(exchange_name, exchange_name.capitalize())
+            try:
+                self.exchanges[exchange_name] = future.result()
+                self.logger.info(f"✓ {display_name} connected")
+            except Exception as e:
+                self.logger.error(f"✗ Failed to connect to {display_name}: {e}")
         
         if len(self.exchanges) < 2:
             self.logger.error("Need at least 2 exchanges to run arbitrage bot")
@@ -80,48 +108,80 @@ class ArbitrageBot:
         
         self.logger.info(f"✓ Successfully connected to {len(self.exchanges)} exchanges\n")
     
-    def fetch_prices(self, symbol: str) -> Dict[str, Dict]:
+    def _start_feeds(self):
+        """Start WebSocket price feeds for all connected exchanges"""
+        if not Config.USE_WEBSOCKETS:
+            return
+        
+        for exchange_name, client in self.exchanges.items():
+            feed = create_price_feed(client, Config.SYMBOLS, Config.QUOTE_CURRENCIES,
+                                     Config.WS_MAX_AGE_MS)
+            if feed:
+                self.feeds[exchange_name] = feed
+                self._feed_tasks.append(asyncio.create_task(feed.run()))
+    
+    async def fetch_prices(self, symbols: List[str]) -> Dict[str, Dict[str, Optional[Ticker]]]:
         """
-        Fetch current prices from all exchanges for a specific symbol
+        Fetch current prices from all exchanges for the given symbols
+        
+        Prices come from the WebSocket feed cache when it is live. Whatever
+        the feeds can't serve is fetched over REST with one batched request
+        per exchange, all exchanges concurrently.
         
         Args:
-            symbol: The cryptocurrency symbol (e.g., 'XLM', 'XRP')
+            symbols: The cryptocurrency symbols (e.g., ['XLM', 'XRP'])
         
         Returns:
-            Dictionary mapping exchange names to ticker data
+            Dictionary mapping each symbol to a dictionary of exchange name -> ticker data
         """
-        tickers = {}
+        prices = {symbol: {} for symbol in symbols}
+        missing: Dict[str, List[str]] = {}
         
-        for exchange_name, client in self.exchanges.items():
-            # Try each quote currency until we find one that works
-            for quote in Config.QUOTE_CURRENCIES:
-                ticker = client.get_ticker(symbol, quote)
-                if ticker:
-                    tickers[exchange_name] = ticker
-                    break
+        for exchange_name in self.exchanges:
+            feed = self.feeds.get(exchange_name)
+            for symbol in symbols:
+                ticker = feed.get_ticker(symbol) if feed else None
+                prices[symbol][exchange_name] = ticker
+                if ticker is None:
+                    missing.setdefault(exchange_name, []).append(symbol)
+        
+        if not missing:
+            return prices
+        
+        results = await asyncio.gather(
+            *[self.exchanges[exchange_name].get_tickers_async(missing_symbols, Config.QUOTE_CURRENCIES)
+              for exchange_name, missing_symbols in missing.items()],
+            return_exceptions=True
+        )
+        
+        for (exchange_name, missing_symbols), tickers in zip(missing.items(), results):
+            if isinstance(tickers, BaseException):
+                tickers = {}
             
-            if exchange_name not in tickers:
-                self.logger.warning(f"Could not fetch {symbol} price from {exchange_name}")
-                tickers[exchange_name] = None
+            for symbol in missing_symbols:
+                prices[symbol][exchange_name] = tickers.get(symbol)
+                
+                if prices[symbol][exchange_name] is None:
+                    self.logger.warning("Could not fetch %s price from %s", symbol, exchange_name)
         
-        return tickers
+        return prices
     
-    def display_prices(self, symbol: str, tickers: Dict[str, Dict]):
+    def display_prices(self, symbol: str, tickers: Dict[str, Optional[Ticker]]):
         """Display current prices in a formatted way"""
-        self.logger.info(f"\n{'─' * 15} {symbol} {'─' * 15}")
+        self.logger.info("\n%s %s %s", '─' * 15, symbol, '─' * 15)
         
         for exchange_name, ticker in tickers.items():
             if ticker:
+                # WebSocket book feeds carry no last trade price
+                last = f"${ticker.last:.6f}" if ticker.last is not None else "n/a"
                 self.logger.info(
-                    f"{exchange_name.upper():10} | "
-                    f"Bid: ${ticker['bid']:.6f} | "
-                    f"Ask: ${ticker['ask']:.6f} | "
-                    f"Last: ${ticker['last']:.6f}"
+                    "%-10s | Bid: $%.6f | Ask: $%.6f | Last: %s",
+                    exchange_name.upper(), ticker.bid, ticker.ask, last
                 )
             else:
-                self.logger.warning(f"{exchange_name.upper():10} | Data unavailable")
+                self.logger.warning("%-10s | Data unavailable", exchange_name.upper())
     
-    def execute_arbitrage(self, opportunity: ArbitrageOpportunity) -> bool:
+    async def execute_arbitrage(self, opportunity: ArbitrageOpportunity) -> bool:
         """
         Execute an arbitrage trade
         
@@ -132,146 +192,223 @@ class ArbitrageBot:
             True if successful, False otherwise
         """
         self.logger.info("\n" + "🚨 " * 15)
-        self.logger.info(f"ARBITRAGE OPPORTUNITY DETECTED!")
-        self.logger.info(str(opportunity))
+        self.logger.info("ARBITRAGE OPPORTUNITY DETECTED!")
+        self.logger.info("%s", opportunity)
         self.logger.info("🚨 " * 15 + "\n")
         
         try:
             buy_client = self.exchanges[opportunity.buy_exchange]
             sell_client = self.exchanges[opportunity.sell_exchange]
             
-            # Calculate trade amount
+            # Calculate trade amount, on a step both exchanges accept so the
+            # legs match exactly
             trade_amount_coins = Config.TRADE_AMOUNT_USD / opportunity.buy_price
+            trade_amount_coins = min(
+                buy_client.amount_to_precision(opportunity.symbol, opportunity.quote, trade_amount_coins),
+                sell_client.amount_to_precision(opportunity.symbol, opportunity.quote, trade_amount_coins)
+            )
             
-            self.logger.info(f"Executing arbitrage trade...")
-            self.logger.info(f"1. Buy {trade_amount_coins:.4f} {opportunity.symbol} on {opportunity.buy_exchange}")
-            self.logger.info(f"2. Sell {trade_amount_coins:.4f} {opportunity.symbol} on {opportunity.sell_exchange}")
+            self.logger.info("Executing arbitrage trade...")
+            self.logger.info("- Buy %.4f %s on %s",
+                             trade_amount_coins, opportunity.symbol, opportunity.buy_exchange)
+            self.logger.info("- Sell %.4f %s on %s",
+                             trade_amount_coins, opportunity.symbol, opportunity.sell_exchange)
             
-            # Execute buy order
-            buy_order = buy_client.place_market_order(
-                opportunity.symbol,
-                opportunity.quote,
-                'buy',
-                trade_amount_coins
+            # Send both legs at once; the spread can close while waiting on one of them
+            buy_order, sell_order = await asyncio.gather(
+                buy_client.place_market_order_async(
+                    opportunity.symbol,
+                    opportunity.quote,
+                    'buy',
+                    trade_amount_coins
+                ),
+                sell_client.place_market_order_async(
+                    opportunity.symbol,
+                    opportunity.quote,
+                    'sell',
+                    trade_amount_coins
+                ),
+                return_exceptions=True
             )
             
-            if not buy_order:
-                self.logger.error("Failed to place buy order")
-                return False
+            buy_placed = bool(buy_order) and not isinstance(buy_order, BaseException)
+            sell_placed = bool(sell_order) and not isinstance(sell_order, BaseException)
             
-            # Execute sell order
-            sell_order = sell_client.place_market_order(
-                opportunity.symbol,
-                opportunity.quote,
-                'sell',
-                trade_amount_coins
-            )
+            if not buy_placed and not sell_placed:
+                self.logger.error("Failed to place buy and sell orders")
+                return False
             
-            if not sell_order:
+            if not sell_placed:
                 self.logger.error("Failed to place sell order")
                 self.logger.warning("⚠️  BUY order was executed but SELL failed - manual intervention needed!")
                 return False
             
-            self.logger.info(f"✓ Arbitrage executed successfully!")
-            self.logger.info(f"✓ Estimated profit: ${opportunity.estimated_profit:.2f}")
+            if not buy_placed:
+                self.logger.error("Failed to place buy order")
+                self.logger.warning("⚠️  SELL order was executed but BUY failed - manual intervention needed!")
+                return False
+            
+            self.logger.info("✓ Arbitrage executed successfully!")
+            self.logger.info("✓ Estimated profit: $%.2f", opportunity.estimated_profit)
             
             self.detector.opportunities_executed += 1
             
             return True
             
         except Exception as e:
-            self.logger.error(f"Error executing arbitrage: {e}")
+            self.logger.error("Error executing arbitrage: %s", e)
             return False
     
-    def run_iteration(self):
+    async def run_iteration(self):
         """Run one iteration of the bot"""
         self.iteration_count += 1
         
-        self.logger.info("\n" + "═" * 60)
-        self.logger.info(f"Iteration #{self.iteration_count} | {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        self.logger.info("═" * 60)
+        # Routine output (prices, statistics) is only logged every LOG_EVERY
+        # iterations; anything involving an opportunity is always logged
+        verbose = self.iteration_count % Config.LOG_EVERY == 0
         
-        all_opportunities = []
+        if verbose:
+            self.logger.info("\n" + "═" * 60)
+            # str() of a whole-second datetime is 'YYYY-MM-DD HH:MM:SS'
+            self.logger.info("Iteration #%d | %s", self.iteration_count, datetime.now().replace(microsecond=0))
+            self.logger.info("═" * 60)
+        
+        best_opportunity = None
+        other_opportunities = []
+        
+        # Fetch prices for every symbol from all exchanges at once
+        all_tickers = await self.fetch_prices(Config.SYMBOLS)
         
         # Check each symbol
-        for symbol in Config.SYMBOLS:
-            # Fetch prices from all exchanges
-            tickers = self.fetch_prices(symbol)
+        for symbol, tickers in all_tickers.items():
+            # Find arbitrage opportunities
+            best, others = self.detector.find_opportunities(tickers)
             
             # Display current prices
-            self.display_prices(symbol, tickers)
+            if verbose or best:
+                self.display_prices(symbol, tickers)
             
-            # Find arbitrage opportunities
-            opportunities = self.detector.find_opportunities(tickers)
-            
-            if opportunities:
-                all_opportunities.extend(opportunities)
-                self.logger.info(f"✓ Found {len(opportunities)} opportunity(ies) for {symbol}")
-            else:
-                self.logger.info(f"○ No opportunities for {symbol}")
+            if best:
+                other_opportunities.extend(others)
+                
+                # Keep the best across all symbols
+                if best_opportunity is None or best.profit_percentage > best_opportunity.profit_percentage:
+                    if best_opportunity is not None:
+                        other_opportunities.append(best_opportunity)
+                    best_opportunity = best
+                else:
+                    other_opportunities.append(best)
+                
+                self.logger.info("✓ Found %d opportunity(ies) for %s", 1 + len(others), symbol)
+            elif verbose:
+                self.logger.info("○ No opportunities for %s", symbol)
         
         # Process all opportunities across all symbols
-        if all_opportunities:
-            # Sort by profit percentage (descending)
-            all_opportunities.sort(key=lambda x: x.profit_percentage, reverse=True)
-            
-            self.logger.info(f"\n{'🎯' * 20}")
-            self.logger.info(f"TOTAL OPPORTUNITIES FOUND: {len(all_opportunities)}")
-            self.logger.info(f"{'🎯' * 20}")
+        if best_opportunity:
+            self.logger.info("\n" + "🎯" * 20)
+            self.logger.info("TOTAL OPPORTUNITIES FOUND: %d", 1 + len(other_opportunities))
+            self.logger.info("🎯" * 20)
             
             # Execute the best opportunity
-            best_opportunity = all_opportunities[0]
-            self.logger.info(f"\n⭐ BEST OPPORTUNITY:")
-            self.execute_arbitrage(best_opportunity)
+            self.logger.info("\n⭐ BEST OPPORTUNITY:")
+            await self.execute_arbitrage(best_opportunity)
             
             # Show other opportunities if any
-            if len(all_opportunities) > 1:
-                self.logger.info(f"\n📊 Other opportunities found: {len(all_opportunities) - 1}")
-                for opp in all_opportunities[1:3]:  # Show top 3 only
-                    self.logger.info(f"  - {opp}")
-                if len(all_opportunities) > 3:
-                    self.logger.info(f"  ... and {len(all_opportunities) - 3} more")
-        else:
-            self.logger.info(f"\n○ No arbitrage opportunities found this iteration")
+            if other_opportunities:
+                self.logger.info("\n📊 Other opportunities found: %d", len(other_opportunities))
+                # Show top 3 only (the best plus the next two)
+                top_others = heapq.nlargest(2, other_opportunities, key=lambda x: x.profit_percentage)
+                for opp in top_others:
+                    self.logger.info("  - %s", opp)
+                if len(other_opportunities) > 2:
+                    self.logger.info("  ... and %d more", len(other_opportunities) - 2)
+        elif verbose:
+            self.logger.info("\n○ No arbitrage opportunities found this iteration")
         
         # Display statistics
-        stats = self.detector.get_statistics()
-        self.logger.info(
-            f"\n📈 Statistics: "
-            f"Opportunities Found: {stats['opportunities_found']} | "
-            f"Executed: {stats['opportunities_executed']}"
-        )
+        if verbose or best_opportunity:
+            stats = self.detector.get_statistics()
+            self.logger.info(
+                "\n📈 Statistics: Opportunities Found: %d | Executed: %d",
+                stats['opportunities_found'], stats['opportunities_executed']
+            )
     
     def run(self):
         """Main bot loop"""
+        try:
+            asyncio.run(self.run_async())
+        except KeyboardInterrupt:
+            pass
+    
+    async def run_async(self):
+        """Async main loop, driven by run()"""
         self.running = True
         self.logger.info("\n" + "🚀 " * 15)
         self.logger.info("Bot started! Press Ctrl+C to stop.")
         self.logger.info("🚀 " * 15 + "\n")
         
+        for client in self.exchanges.values():
+            await client.open()
+        self._start_feeds()
+        
+        # Iterations are scheduled against fixed deadlines so the cadence stays
+        # at CHECK_INTERVAL_SECONDS regardless of how long each one takes
+        next_tick = time.monotonic()
+        
         try:
             while self.running:
                 try:
-                    self.run_iteration()
-                    time.sleep(Config.CHECK_INTERVAL_SECONDS)
+                    drift = time.monotonic() - next_tick
+                    if drift > 0.01:
+                        self.logger.debug("Iteration started %.0fms late", drift * 1000)
+                    
+                    await self.run_iteration()
+                    
+                    next_tick += Config.CHECK_INTERVAL_SECONDS
+                    sleep_for = next_tick - time.monotonic()
+                    if sleep_for > 0:
+                        await asyncio.sleep(sleep_for)
+                    else:
+                        self.logger.warning(
+                            "Iteration overran the %ss interval by %.2fs",
+                            Config.CHECK_INTERVAL_SECONDS, -sleep_for
+                        )
+                        # Start the next one now rather than bursting to catch up
+                        next_tick = time.monotonic()
                     
-                except KeyboardInterrupt:
+                except (KeyboardInterrupt, asyncio.CancelledError):
                     raise
                 except Exception as e:
-                    self.logger.error(f"Error in iteration: {e}")
+                    self.logger.error("Error in iteration: %s", e)
                     self.logger.info("Continuing in 5 seconds...")
-                    time.sleep(5)
+                    await asyncio.sleep(5)
+                    next_tick = time.monotonic()
         
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, asyncio.CancelledError):
             self.logger.info("\n\n" + "🛑 " * 15)
             self.logger.info("Shutting down bot...")
             self.logger.info("🛑 " * 15)
-            self.stop()
+        
+        finally:
+            await self.stop()
     
-    def stop(self):
+    async def stop(self):
         """Stop the bot gracefully"""
         self.running = False
         
+        # Stop WebSocket feeds
+        for task in self._feed_tasks:
+            task.cancel()
+        await asyncio.gather(*self._feed_tasks, return_exceptions=True)
+        self._feed_tasks = []
+        
+        # Release exchange connections
+        for client in self.exchanges.values():
+            try:
+                await client.close()
+            except Exception as e:
+                self.logger.error(f"Error closing {client.exchange_name}: {e}")
+        
         # Display final statistics
         stats = self.detector.get_statistics()
         self.logger.info("\nFinal Statistics:")
@@ -284,9 +421,12 @@ class ArbitrageBot:
         
         self.logger.info("\n✓ Bot stopped successfully\n")
 
-
 def main():
     """Main entry point"""
+    # libuv-based event loop: lower per-await overhead on every REST/WS operation
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     bot = ArbitrageBot()
     bot.run()
 
@@ -1,24 +1,101 @@
-from typing import Dict, List, Optional, Tuple
+import time
+from typing import Optional
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; run the kernels as plain Python
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
 from config import Config
+from models import Ticker
+
+
+# Assumed maker/taker fee on each side, and the round-trip cost in percent
+_FEE_RATE = 0.001
+_TOTAL_FEE_PCT = 2 * _FEE_RATE * 100
+_TRADE_USD = Config.TRADE_AMOUNT_USD
 
 
+@lru_cache(maxsize=None)
+def _split_pair(pair: str) -> tuple[str, str]:
+    """Split 'XLM/USDT' into ('XLM', 'USDT'); the set of pairs is small and fixed"""
+    symbol, quote = pair.split('/')
+    return symbol, quote
+
+
+@njit(cache=True, fastmath=True)
+def _profit(buy_ask: float, sell_bid: float, trade_usd: float,
+            fee: float = _FEE_RATE) -> tuple[float, float]:
+    """
+    Profit of buying at buy_ask and selling at sell_bid, net of fees
+    
+    Args:
+        buy_ask: Ask price on the buy exchange
+        sell_bid: Bid price on the sell exchange
+        trade_usd: Trade size in quote currency
+        fee: Fee rate charged on each side
+    
+    Returns:
+        Tuple of (profit_percentage, estimated_profit)
+    """
+    coins = trade_usd / buy_ask
+    gross = (sell_bid - buy_ask) * coins
+    estimated = gross - trade_usd * fee - coins * sell_bid * fee
+    percentage = (sell_bid - buy_ask) / buy_ask * 100 - 2 * fee * 100
+    return percentage, estimated
+
+
+@njit(cache=True)
+def _best_2way(ask_a: float, bid_a: float, ask_b: float, bid_b: float,
+               fee_pct: float, min_pct: float) -> tuple[int, float]:
+    """
+    Better direction between exactly two exchanges, if it clears min_pct
+    
+    Args:
+        ask_a, bid_a: Ask/bid on exchange a
+        ask_b, bid_b: Ask/bid on exchange b
+        fee_pct: Round-trip fee in percent
+        min_pct: Minimum net profit percentage
+    
+    Returns:
+        Tuple of (0 to buy on a/sell on b, 1 for the reverse, -1 for neither;
+        net profit percentage)
+    """
+    p_ab = (bid_b - ask_a) / ask_a * 100 - fee_pct
+    p_ba = (bid_a - ask_b) / ask_b * 100 - fee_pct
+    if p_ab >= p_ba and p_ab >= min_pct:
+        return 0, p_ab
+    if p_ba >= min_pct:
+        return 1, p_ba
+    return -1, 0.0
+
+
+@dataclass(slots=True, frozen=True)
 class ArbitrageOpportunity:
     """Represents a detected arbitrage opportunity"""
     
-    def __init__(self, buy_exchange: str, sell_exchange: str, 
-                 symbol: str, quote: str,
-                 buy_price: float, sell_price: float,
-                 profit_percentage: float, estimated_profit: float):
-        self.buy_exchange = buy_exchange
-        self.sell_exchange = sell_exchange
-        self.symbol = symbol
-        self.quote = quote
-        self.buy_price = buy_price
-        self.sell_price = sell_price
-        self.profit_percentage = profit_percentage
-        self.estimated_profit = estimated_profit
-        self.timestamp = datetime.now()
+    buy_exchange: str
+    sell_exchange: str
+    symbol: str
+    quote: str
+    buy_price: float
+    sell_price: float
+    profit_percentage: float
+    estimated_profit: float
+    # Raw epoch nanoseconds; only turned into a datetime when actually read
+    timestamp_ns: int = field(default_factory=time.time_ns)
+    
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
     
     def __str__(self):
         return (f"Arbitrage Opportunity: Buy {self.symbol} on {self.buy_exchange} "
@@ -47,8 +124,17 @@ class ArbitrageDetector:
         self.min_profit_percentage = min_profit_percentage or Config.MIN_PROFIT_PERCENTAGE
         self.opportunities_found = 0
         self.opportunities_executed = 0
+        
+        # Compile (or load from cache) the JIT kernel now rather than on the
+        # first real price check
+        _profit(1.0, 1.0, 1.0)
+        _best_2way(1.0, 1.0, 1.0, 1.0, 0.0, 0.0)
+        
+        # Upper-triangle pair indices per exchange count; built once per size
+        self._pair_idx: dict[int, tuple[np.ndarray, np.ndarray]] = {}
     
-    def find_opportunities(self, tickers: Dict[str, Dict]) -> List[ArbitrageOpportunity]:
+    def find_opportunities(self, tickers: dict[str, Optional[Ticker]]
+                           ) -> tuple[Optional[ArbitrageOpportunity], list[ArbitrageOpportunity]]:
         """
         Find arbitrage opportunities from ticker data
         
@@ -56,45 +142,95 @@ class ArbitrageDetector:
             tickers: Dictionary mapping exchange names to their ticker data
         
         Returns:
-            List of ArbitrageOpportunity objects
+            Tuple of (most profitable opportunity or None, other opportunities in no
+            particular order)
         """
-        opportunities = []
+        best = None
+        others = []
         
-        # Get list of exchanges with valid data
-        valid_exchanges = [ex for ex, data in tickers.items() if data is not None]
+        # Get list of exchanges with valid data (usually all of them)
+        if all(data is not None for data in tickers.values()):
+            valid_exchanges = list(tickers)
+        else:
+            valid_exchanges = [ex for ex, data in tickers.items() if data is not None]
         
         if len(valid_exchanges) < 2:
-            return opportunities
+            return best, others
         
-        # Compare each pair of exchanges
-        for i, exchange1 in enumerate(valid_exchanges):
-            for exchange2 in valid_exchanges[i+1:]:
-                ticker1 = tickers[exchange1]
-                ticker2 = tickers[exchange2]
-                
-                # Check both directions (buy on 1, sell on 2 and vice versa)
-                opp1 = self._check_opportunity(
-                    exchange1, exchange2,
-                    ticker1, ticker2
-                )
-                
-                opp2 = self._check_opportunity(
-                    exchange2, exchange1,
-                    ticker2, ticker1
-                )
-                
-                if opp1:
-                    opportunities.append(opp1)
-                if opp2:
-                    opportunities.append(opp2)
+        # Two exchanges is the configured setup; skip the array machinery
+        # unless a price is missing or unusable
+        if len(valid_exchanges) == 2:
+            ticker_a, ticker_b = (tickers[ex] for ex in valid_exchanges)
+            prices = (ticker_a.ask, ticker_a.bid, ticker_b.ask, ticker_b.bid)
+            if None not in prices and prices[0] > 0 and prices[2] > 0:
+                best = self._find_2way(*valid_exchanges, ticker_a, ticker_b)
+                if best is not None:
+                    self.opportunities_found += 1
+                return best, others
+        
+        # Missing prices become NaN and never pass the threshold below
+        asks = np.array([tickers[ex].ask for ex in valid_exchanges], dtype=float)
+        bids = np.array([tickers[ex].bid for ex in valid_exchanges], dtype=float)
+        
+        # Every unordered pair once, with the profit of buying on a/selling on b
+        # and of the reverse trade
+        a, b = self._pairs(len(valid_exchanges))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            forward = (bids[b] - asks[a]) / asks[a] * 100 - _TOTAL_FEE_PCT
+            reverse = (bids[a] - asks[b]) / asks[b] * 100 - _TOTAL_FEE_PCT
         
-        if opportunities:
-            self.opportunities_found += len(opportunities)
+        # With fees, at most one direction of a pair can be profitable, so only
+        # the better one is checked (fmax/isnan keep a valid side if the other is NaN)
+        profit = np.fmax(forward, reverse)
+        use_forward = (forward >= reverse) | np.isnan(reverse)
+        buy_idx = np.where(use_forward, a, b)
+        sell_idx = np.where(use_forward, b, a)
         
-        return opportunities
+        # Only build opportunity objects for the pairs that clear the threshold
+        keep = profit >= self.min_profit_percentage
+        
+        for i, j in zip(buy_idx[keep].tolist(), sell_idx[keep].tolist()):
+            opportunity = self._check_opportunity(
+                valid_exchanges[i], valid_exchanges[j],
+                tickers[valid_exchanges[i]], tickers[valid_exchanges[j]]
+            )
+            if opportunity is None:
+                continue
+            
+            # Track the best one as we go instead of sorting afterwards
+            if best is None or opportunity.profit_percentage > best.profit_percentage:
+                if best is not None:
+                    others.append(best)
+                best = opportunity
+            else:
+                others.append(opportunity)
+        
+        if best is not None:
+            self.opportunities_found += 1 + len(others)
+        
+        return best, others
+    
+    def _find_2way(self, ex_a: str, ex_b: str, ticker_a: Ticker,
+                   ticker_b: Ticker) -> Optional[ArbitrageOpportunity]:
+        """Scalar find_opportunities for exactly two exchanges with full quotes"""
+        direction, _ = _best_2way(float(ticker_a.ask), float(ticker_a.bid),
+                                  float(ticker_b.ask), float(ticker_b.bid),
+                                  _TOTAL_FEE_PCT, self.min_profit_percentage)
+        if direction == 0:
+            return self._check_opportunity(ex_a, ex_b, ticker_a, ticker_b)
+        if direction == 1:
+            return self._check_opportunity(ex_b, ex_a, ticker_b, ticker_a)
+        return None
+    
+    def _pairs(self, count: int) -> tuple[np.ndarray, np.ndarray]:
+        """Index arrays (a, b) covering every exchange pair a < b"""
+        pairs = self._pair_idx.get(count)
+        if pairs is None:
+            pairs = self._pair_idx[count] = np.triu_indices(count, k=1)
+        return pairs
     
     def _check_opportunity(self, buy_exchange: str, sell_exchange: str,
-                          buy_ticker: Dict, sell_ticker: Dict) -> Optional[ArbitrageOpportunity]:
+                          buy_ticker: Ticker, sell_ticker: Ticker) -> Optional[ArbitrageOpportunity]:
         """
         Check if there's an arbitrage opportunity between two exchanges
         
@@ -109,30 +245,20 @@ class ArbitrageDetector:
         """
         try:
             # Use ask price (lowest sell price) for buying
-            buy_price = buy_ticker['ask']
+            buy_price = buy_ticker.ask
             # Use bid price (highest buy price) for selling
-            sell_price = sell_ticker['bid']
+            sell_price = sell_ticker.bid
             
             if buy_price is None or sell_price is None:
                 return None
             
-            # Calculate profit percentage (after fees)
-            # Assuming maker/taker fee of 0.1% on each side (0.2% total)
-            fee_percentage = 0.2
-            profit_percentage = ((sell_price - buy_price) / buy_price * 100) - fee_percentage
+            # Profit after the assumed 0.1% maker/taker fee on each side
+            profit_percentage, estimated_profit = _profit(
+                float(buy_price), float(sell_price), _TRADE_USD
+            )
             
             if profit_percentage >= self.min_profit_percentage:
-                # Calculate estimated profit based on trade amount
-                trade_amount_coins = Config.TRADE_AMOUNT_USD / buy_price
-                estimated_profit = (sell_price - buy_price) * trade_amount_coins
-                
-                # Subtract fees
-                buy_fee = Config.TRADE_AMOUNT_USD * 0.001  # 0.1% fee
-                sell_fee = (trade_amount_coins * sell_price) * 0.001  # 0.1% fee
-                estimated_profit -= (buy_fee + sell_fee)
-                
-                symbol = buy_ticker['symbol'].split('/')[0]
-                quote = buy_ticker['symbol'].split('/')[1]
+                symbol, quote = _split_pair(buy_ticker.symbol)
                 
                 return ArbitrageOpportunity(
                     buy_exchange=buy_exchange,
@@ -147,7 +273,7 @@ class ArbitrageDetector:
             
             return None
             
-        except (KeyError, TypeError, ZeroDivisionError) as e:
+        except (KeyError, TypeError, ValueError, ZeroDivisionError) as e:
             print(f"Error checking opportunity: {e}")
             return None
     
@@ -178,7 +304,7 @@ class ArbitrageDetector:
         
         return optimal_amount
     
-    def get_statistics(self) -> Dict:
+    def get_statistics(self) -> dict:
         """Get statistics about detected opportunities"""
         return {
             'opportunities_found': self.opportunities_found,
@@ -11,8 +11,8 @@ import os
 def check_python_version():
     """Check Python version"""
     print("Checking Python version...")
-    if sys.version_info < (3, 8):
-        print("  ✗ Python 3.8 or higher is required")
+    if sys.version_info < (3, 10):
+        print("  ✗ Python 3.10 or higher is required")
         print(f"  Current version: {sys.version}")
         return False
     print(f"  ✓ Python {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}")
@@ -22,7 +22,7 @@ def check_python_version():
 def check_dependencies():
     """Check if required packages are installed"""
     print("\nChecking dependencies...")
-    required_packages = ['ccxt', 'dotenv', 'requests', 'colorama']
+    required_packages = ['ccxt', 'dotenv', 'requests', 'colorama', 'websockets', 'numpy']
     missing = []
     
     for package in required_packages:
@@ -96,18 +96,18 @@ def check_exchange_connectivity():
     print("\nChecking exchange connectivity...")
     
     try:
-        from exchange_client import BinanceClient, KrakenClient
+        from exchange_client import make_client
         
         # Test Binance
         try:
-            binance = BinanceClient()
+            binance = make_client('binance')
             print("  ✓ Binance.US connection successful")
         except Exception as e:
             print(f"  ⚠ Binance.US connection failed: {e}")
         
         # Test Kraken
         try:
-            kraken = KrakenClient()
+            kraken = make_client('kraken')
             print("  ✓ Kraken connection successful")
         except Exception as e:
             print(f"  ⚠ Kraken connection failed: {e}")
@@ -19,6 +19,13 @@ class Config:
     CHECK_INTERVAL_SECONDS = int(os.getenv('CHECK_INTERVAL_SECONDS', '5'))
     TRADE_AMOUNT_USD = float(os.getenv('TRADE_AMOUNT_USD', '100'))
     
+    # Logging
+    LOG_EVERY = int(os.getenv('LOG_EVERY', '1'))  # Log prices/stats every N iterations
+    
+    # Market Data
+    USE_WEBSOCKETS = os.getenv('USE_WEBSOCKETS', 'true').lower() == 'true'
+    WS_MAX_AGE_MS = int(os.getenv('WS_MAX_AGE_MS', '5000'))  # Older feed quotes fall back to REST
+    
     # Safety Settings
     DRY_RUN = os.getenv('DRY_RUN', 'true').lower() == 'true'
     
@@ -44,5 +51,11 @@ class Config:
         if cls.TRADE_AMOUNT_USD <= 0:
             raise ValueError("TRADE_AMOUNT_USD must be positive")
         
+        if cls.LOG_EVERY < 1:
+            raise ValueError("LOG_EVERY must be at least 1")
+        
+        if cls.WS_MAX_AGE_MS <= 0:
+            raise ValueError("WS_MAX_AGE_MS must be positive")
+        
         return True
 
@@ -1,53 +1,201 @@
+import asyncio
+import logging
+import ssl
+import aiohttp
+import certifi
+import json
+import random
 import ccxt
+import requests
+from requests.adapters import HTTPAdapter
+import ccxt.async_support as ccxt_async
 import time
-from typing import Optional, Dict, Tuple
+from typing import Optional, Dict, List, Tuple
 from config import Config
+from models import Ticker
+from rate_limiter import TokenBucket
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; ccxt keeps its stdlib json decoder
+    orjson = None
+
+
+def _orjson_parse_json(self, http_response):
+    """
+    Drop-in replacement for ccxt's Exchange.parse_json backed by orjson
+    
+    Like the original, non-JSON bodies return None. Numbers decode to
+    int/float rather than strings; ccxt's safe_* accessors accept both.
+    """
+    try:
+        if ccxt.Exchange.is_json_encoded_object(http_response):
+            return orjson.loads(http_response)
+    except ValueError:
+        pass
+    return None
+
+
+if orjson is not None:
+    ccxt.Exchange.parse_json = _orjson_parse_json
+
+
+# Async request budgets per exchange and endpoint group, as
+# (burst capacity, refill per second) in request weight
+RATE_LIMITS = {
+    'binance': {
+        'market': (1200, 20.0),  # 1200 request weight per minute
+        'order': (50, 5.0),      # 50 orders per 10 seconds
+    },
+    'kraken': {
+        'market': (15, 1.0),     # Public endpoints: about one call per second
+        'order': (15, 0.33),     # Starter-tier private call counter
+    },
+}
+
+# Request weight of the market data calls, where the exchange charges more than 1
+MARKET_WEIGHTS = {
+    'binance': {
+        'fetch_ticker': 2,
+        'fetch_tickers': 2,  # ticker/24hr restricted to 1-20 symbols
+    },
+}
 
 
 class ExchangeClient:
-    """Base class for exchange API clients"""
+    """
+    API client for one exchange, holding a sync and an async ccxt instance
+    
+    The bot itself only uses the async methods. The sync ones (get_ticker,
+    get_tickers, get_balance, place_market_order, get_trading_fees) have no
+    callers in this repo and are kept as public API for scripts.
+    """
+    
+    # Upper bound on orders in flight at once on a single exchange
+    MAX_CONCURRENT_ORDERS = 2
+    
+    # Fee schedules change rarely; recompute them at most this often
+    FEE_CACHE_TTL_SECONDS = 3600
+    
+    # Live balances are re-fetched at most this often, or after an order
+    BALANCE_CACHE_TTL_SECONDS = 2
+    
+    # Market data requests are retried on transient transport errors (timeouts,
+    # dropped connections, DNS failures) with exponential backoff:
+    # base * 2**attempt plus up to base of random jitter. Rate limiting,
+    # maintenance and nonce errors are never retried.
+    RETRY_ATTEMPTS = 3
+    RETRY_BASE_DELAY_SECONDS = 0.1
     
     def __init__(self, exchange_name: str):
         self.exchange_name = exchange_name
+        self.logger = logging.getLogger('arbitrage_bot').getChild(exchange_name)
         self.exchange = None
+        self.async_exchange = None
+        self._order_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_ORDERS)
+        
+        # (symbol, quote) -> market pair, or None if the exchange doesn't list it;
+        # markets are fixed after load_markets() so entries never go stale
+        self._pair_cache: Dict[Tuple[str, str], Optional[str]] = {}
+        
+        # Snapshot of the loaded market names, taken after load_markets()
+        self._market_names: frozenset = frozenset()
+        
+        # (symbol, quote) -> (maker_fee, taker_fee, monotonic time computed)
+        self._fee_cache: Dict[Tuple[str, str], Tuple[float, float, float]] = {}
+        
+        # Free balance per currency from the last fetch_balance, and when it ran
+        self._balances: Dict[str, float] = {}
+        self._balances_fetched_at: Optional[float] = None
+        
+        # Token buckets pacing the async client, one per endpoint group
+        self._buckets: Dict[str, TokenBucket] = {
+            group: TokenBucket(capacity, rate)
+            for group, (capacity, rate) in RATE_LIMITS.get(exchange_name, {}).items()
+        }
+        
         self._initialize_exchange()
     
     def _initialize_exchange(self):
         """Initialize the exchange connection"""
         try:
-            if self.exchange_name == 'binance':
-                self.exchange = ccxt.binance({
-                    'apiKey': Config.BINANCE_API_KEY,
-                    'secret': Config.BINANCE_API_SECRET,
-                    'enableRateLimit': True,
-                    'options': {
-                        'defaultType': 'spot',
-                    }
-                })
-                # Binance.US for US region
-                self.exchange.urls['api'] = self.exchange.urls['api'].replace(
-                    'https://api.binance.com', 
-                    'https://api.binance.us'
-                )
-                
-            elif self.exchange_name == 'kraken':
-                self.exchange = ccxt.kraken({
-                    'apiKey': Config.KRAKEN_API_KEY,
-                    'secret': Config.KRAKEN_API_SECRET,
-                    'enableRateLimit': True,
-                })
-            else:
-                raise ValueError(f"Unsupported exchange: {self.exchange_name}")
+            self.exchange = self._create_exchange(ccxt)
+            self.exchange.session = self._create_sync_session(self.exchange.requests_trust_env)
             
             # Load markets
             self.exchange.load_markets()
-            print(f"✓ Connected to {self.exchange_name}")
+            self._market_names = frozenset(self.exchange.markets)
+            
+            # Resolve the configured pairs now rather than on the first poll
+            self._check_pairs(Config.SYMBOLS, Config.QUOTE_CURRENCIES)
+            
+            # Async twin used for concurrent price fetching; it shares the
+            # markets loaded above so startup still costs a single round-trip
+            self.async_exchange = self._create_exchange(ccxt_async)
+            self.async_exchange.set_markets(self.exchange.markets, self.exchange.currencies)
+            
+            # Async requests are paced by our own token buckets instead of
+            # ccxt's throttler, so concurrent calls can use the full budget
+            if self._buckets:
+                self.async_exchange.enableRateLimit = False
+            
+            self.logger.info("✓ Connected to %s", self.exchange_name)
             
         except Exception as e:
-            print(f"✗ Error initializing {self.exchange_name}: {e}")
+            self.logger.error("✗ Error initializing %s: %s", self.exchange_name, e)
             raise
     
-    def get_ticker(self, symbol: str, quote: str) -> Optional[Dict]:
+    def _create_exchange(self, module):
+        """
+        Instantiate the ccxt exchange class for this client
+        
+        Args:
+            module: ccxt module to take the class from (sync or async_support)
+        
+        Returns:
+            Configured ccxt exchange instance
+        """
+        if self.exchange_name == 'binance':
+            # Binance.US for US region
+            return module.binanceus({
+                'apiKey': Config.BINANCE_API_KEY,
+                'secret': Config.BINANCE_API_SECRET,
+                'enableRateLimit': True,
+                'options': {
+                    'defaultType': 'spot',
+                }
+            })
+        
+        if self.exchange_name == 'kraken':
+            return module.kraken({
+                'apiKey': Config.KRAKEN_API_KEY,
+                'secret': Config.KRAKEN_API_SECRET,
+                'enableRateLimit': True,
+            })
+        
+        raise ValueError(f"Unsupported exchange: {self.exchange_name}")
+    
+    @staticmethod
+    def _create_sync_session(trust_env: bool) -> requests.Session:
+        """
+        Keep-alive HTTP session for the sync client
+        
+        Sync calls (startup, setup checks, fallbacks) reuse pooled
+        connections instead of paying a TCP/TLS handshake each time.
+        
+        Args:
+            trust_env: Whether to pick up proxy and CA settings from the
+                environment; pass ccxt's requests_trust_env so the session
+                behaves like the one it replaces
+        """
+        session = requests.Session()
+        session.trust_env = trust_env
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
+    def get_ticker(self, symbol: str, quote: str) -> Optional[Ticker]:
         """
         Get current ticker information for a trading pair
         
@@ -56,7 +204,7 @@ class ExchangeClient:
             quote: Quote currency (e.g., 'USDT', 'USD')
         
         Returns:
-            Dictionary with ticker data or None if error
+            Ticker or None if error
         """
         try:
             # Format the trading pair according to exchange standards
@@ -67,26 +215,216 @@ class ExchangeClient:
             
             ticker = self.exchange.fetch_ticker(pair)
             
-            return {
-                'exchange': self.exchange_name,
-                'symbol': pair,
-                'bid': ticker['bid'],  # Highest buy price
-                'ask': ticker['ask'],  # Lowest sell price
-                'last': ticker['last'],
-                'timestamp': ticker['timestamp'],
-                'datetime': ticker['datetime']
-            }
+            return self._format_ticker(pair, ticker)
             
         except ccxt.NetworkError as e:
-            print(f"Network error on {self.exchange_name}: {e}")
+            self.logger.warning("Network error on %s: %s", self.exchange_name, e)
             return None
         except ccxt.ExchangeError as e:
-            print(f"Exchange error on {self.exchange_name}: {e}")
+            self.logger.warning("Exchange error on %s: %s", self.exchange_name, e)
             return None
         except Exception as e:
-            print(f"Unexpected error getting ticker from {self.exchange_name}: {e}")
+            self.logger.error("Unexpected error getting ticker from %s: %s", self.exchange_name, e)
             return None
     
+    def get_tickers(self, symbols: List[str], quotes: List[str]) -> Dict[str, Ticker]:
+        """
+        Get tickers for several symbols in a single request
+        
+        For each symbol only the first quote (in the given priority order)
+        listed on the exchange is requested, all in one fetch_tickers call.
+        Exchanges without fetch_tickers are queried pair by pair instead.
+        
+        Args:
+            symbols: Base currencies (e.g., ['XLM', 'XRP'])
+            quotes: Quote currencies in priority order (e.g., ['USDT', 'USD'])
+        
+        Returns:
+            Dictionary mapping base symbol to ticker data; symbols without data are omitted
+        """
+        try:
+            preferred = self._preferred_pairs(symbols, quotes)
+            pairs = list(preferred.values())
+            
+            if not pairs:
+                return {}
+            
+            try:
+                raw = self.exchange.fetch_tickers(pairs, self._tickers_params(pairs))
+            except ccxt.NotSupported:
+                raw = {}
+                for pair in pairs:
+                    try:
+                        raw[pair] = self.exchange.fetch_ticker(pair)
+                    except ccxt.BaseError as e:
+                        self.logger.warning("Error fetching %s on %s: %s", pair, self.exchange_name, e)
+            
+            return self._pick_tickers(preferred, raw)
+            
+        except ccxt.NetworkError as e:
+            self.logger.warning("Network error on %s: %s", self.exchange_name, e)
+            return {}
+        except ccxt.ExchangeError as e:
+            self.logger.warning("Exchange error on %s: %s", self.exchange_name, e)
+            return {}
+        except Exception as e:
+            self.logger.error("Unexpected error getting tickers from %s: %s", self.exchange_name, e)
+            return {}
+    
+    async def get_tickers_async(self, symbols: List[str], quotes: List[str]) -> Dict[str, Ticker]:
+        """
+        Async variant of get_tickers
+        
+        Args:
+            symbols: Base currencies (e.g., ['XLM', 'XRP'])
+            quotes: Quote currencies in priority order (e.g., ['USDT', 'USD'])
+        
+        Returns:
+            Dictionary mapping base symbol to ticker data; symbols without data are omitted
+        """
+        try:
+            preferred = self._preferred_pairs(symbols, quotes)
+            pairs = list(preferred.values())
+            
+            if not pairs:
+                return {}
+            
+            try:
+                params = self._tickers_params(pairs)
+                raw = await self._fetch_with_retry(
+                    lambda: self.async_exchange.fetch_tickers(pairs, params),
+                    self._weight('fetch_tickers')
+                )
+            except ccxt.NotSupported:
+                results = await asyncio.gather(
+                    *[self._fetch_with_retry(lambda pair=pair: self.async_exchange.fetch_ticker(pair),
+                                             self._weight('fetch_ticker'))
+                      for pair in pairs],
+                    return_exceptions=True
+                )
+                raw = {}
+                for pair, ticker in zip(pairs, results):
+                    if isinstance(ticker, BaseException):
+                        self.logger.warning("Error fetching %s on %s: %s", pair, self.exchange_name, ticker)
+                    else:
+                        raw[pair] = ticker
+            
+            return self._pick_tickers(preferred, raw)
+            
+        except ccxt.NetworkError as e:
+            self.logger.warning("Network error on %s: %s", self.exchange_name, e)
+            return {}
+        except ccxt.ExchangeError as e:
+            self.logger.warning("Exchange error on %s: %s", self.exchange_name, e)
+            return {}
+        except Exception as e:
+            self.logger.error("Unexpected error getting tickers from %s: %s", self.exchange_name, e)
+            return {}
+    
+    def preferred_markets(self, symbols: List[str], quotes: List[str]) -> Dict[str, Dict]:
+        """
+        Market for each base symbol, picking the first quote it trades in
+        
+        Args:
+            symbols: Base currencies (e.g., ['XLM', 'XRP'])
+            quotes: Quote currencies in priority order (e.g., ['USDT', 'USD'])
+        
+        Returns:
+            Dict mapping base symbol to its ccxt market; unlisted symbols are omitted
+        """
+        return {symbol: self.exchange.markets[pair]
+                for symbol, pair in self._preferred_pairs(symbols, quotes).items()}
+    
+    async def _fetch_with_retry(self, request, weight: float = 1):
+        """
+        Await request(), retrying transient transport errors with backoff and jitter
+        
+        Retried: RequestTimeout, and ExchangeNotAvailable other than
+        OnMaintenance. ccxt's async fetch raises the latter for connection
+        resets, server disconnects and DNS failures. Raised at once:
+        DDoSProtection/RateLimitExceeded (retrying a 429 within a second is how
+        an IP gets banned), OnMaintenance and InvalidNonce.
+        
+        Only for idempotent reads; orders are never retried because a network
+        error can hide an order that was actually placed.
+        
+        Args:
+            request: Zero-argument callable returning a fresh awaitable per attempt
+            weight: Market data budget each attempt consumes
+        
+        Returns:
+            The request's result; the last error is re-raised once
+            RETRY_ATTEMPTS attempts have failed
+        """
+        for attempt in range(self.RETRY_ATTEMPTS):
+            try:
+                await self._throttle('market', weight)
+                return await request()
+            except ccxt.NetworkError as e:
+                transient = (
+                    isinstance(e, ccxt.RequestTimeout)
+                    or (isinstance(e, ccxt.ExchangeNotAvailable) and not isinstance(e, ccxt.OnMaintenance))
+                )
+                if not transient or attempt == self.RETRY_ATTEMPTS - 1:
+                    raise
+                delay = self.RETRY_BASE_DELAY_SECONDS * (2 ** attempt + random.random())
+                self.logger.debug("Network error on %s, retrying in %.2fs: %s",
+                                  self.exchange_name, delay, e)
+                await asyncio.sleep(delay)
+    
+    def _weight(self, method: str) -> float:
+        """Request weight of a ccxt market data method on this exchange"""
+        return MARKET_WEIGHTS.get(self.exchange_name, {}).get(method, 1)
+    
+    async def _throttle(self, group: str, weight: float = 1):
+        """Wait for budget in an endpoint group's token bucket, if it has one"""
+        bucket = self._buckets.get(group)
+        if bucket is not None:
+            await bucket.acquire(weight)
+    
+    def _preferred_pairs(self, symbols: List[str], quotes: List[str]) -> Dict[str, str]:
+        """First listed market pair per base symbol, in quote priority order"""
+        preferred = {}
+        for symbol in symbols:
+            pair = next((pair for pair in (self._format_pair(symbol, quote) for quote in quotes)
+                         if pair), None)
+            if pair:
+                preferred[symbol] = pair
+        return preferred
+    
+    def _tickers_params(self, pairs: List[str]) -> Dict:
+        """
+        Extra fetch_tickers parameters limiting the response to the given pairs
+        
+        ccxt's Binance fetch_tickers requests ticker/24hr for every market and
+        filters on the client; the symbols parameter has the server do it.
+        Kraken already sends only the requested pairs.
+        """
+        if self.exchange_name == 'binance':
+            ids = [self.exchange.markets[pair]['id'] for pair in pairs]
+            return {'symbols': json.dumps(ids, separators=(',', ':'))}
+        return {}
+    
+    def _pick_tickers(self, preferred: Dict[str, str], raw: Dict[str, Dict]) -> Dict[str, Ticker]:
+        """Take each symbol's preferred pair from a fetch_tickers response"""
+        return {
+            symbol: self._format_ticker(pair, raw[pair])
+            for symbol, pair in preferred.items()
+            if pair in raw
+        }
+    
+    def _format_ticker(self, pair: str, ticker: Dict) -> Ticker:
+        """Reduce a ccxt ticker to the fields the bot uses"""
+        return Ticker(
+            self.exchange_name,
+            pair,
+            ticker['bid'],
+            ticker['ask'],
+            ticker['last'],
+            ticker['timestamp'],
+            ticker['datetime']
+        )
+    
     def _format_pair(self, symbol: str, quote: str) -> Optional[str]:
         """
         Format trading pair according to exchange standards
@@ -98,11 +436,41 @@ class ExchangeClient:
         Returns:
             Formatted pair string or None if not available
         """
+        key = (symbol, quote)
+        if key in self._pair_cache:
+            return self._pair_cache[key]
+        
+        pair = self._resolve_pair(symbol, quote)
+        self._pair_cache[key] = pair
+        return pair
+    
+    def _check_pairs(self, symbols: List[str], quotes: List[str]):
+        """
+        Resolve every symbol/quote pair, requiring each symbol to trade in some quote
+        
+        Raises:
+            ValueError: If a symbol has no market in any of the quotes
+        """
+        missing = []
+        for symbol in symbols:
+            # Resolve every quote, not just the first listed one, so the
+            # pair cache is complete before the first poll
+            pairs = [self._format_pair(symbol, quote) for quote in quotes]
+            if not any(pairs):
+                missing.append(symbol)
+        
+        if missing:
+            raise ValueError(
+                f"No {'/'.join(quotes)} market for {', '.join(missing)} on {self.exchange_name}"
+            )
+    
+    def _resolve_pair(self, symbol: str, quote: str) -> Optional[str]:
+        """Look up the market name for a pair; _format_pair memoizes the result"""
         # Standard format
         pair = f"{symbol}/{quote}"
         
         # Check if pair exists on exchange
-        if pair in self.exchange.markets:
+        if pair in self._market_names:
             return pair
         
         # Try alternative formats
@@ -112,10 +480,10 @@ class ExchangeClient:
         ]
         
         for alt in alternatives:
-            if alt in self.exchange.markets:
+            if alt in self._market_names:
                 return alt
         
-        print(f"Warning: Pair {symbol}/{quote} not found on {self.exchange_name}")
+        self.logger.debug("Pair %s/%s not listed on %s", symbol, quote, self.exchange_name)
         return None
     
     def get_balance(self, currency: str) -> float:
@@ -133,13 +501,46 @@ class ExchangeClient:
                 # Return dummy balance in dry run mode
                 return 1000.0
             
-            balance = self.exchange.fetch_balance()
-            return balance.get(currency, {}).get('free', 0.0)
+            # One signed request refreshes every currency at once
+            fetched_at = self._balances_fetched_at
+            if fetched_at is None or time.monotonic() - fetched_at >= self.BALANCE_CACHE_TTL_SECONDS:
+                balance = self.exchange.fetch_balance()
+                self._balances = {
+                    code: entry.get('free') or 0.0
+                    for code, entry in balance.items()
+                    if isinstance(entry, dict) and 'free' in entry
+                }
+                self._balances_fetched_at = time.monotonic()
+            
+            return self._balances.get(currency, 0.0)
             
         except Exception as e:
-            print(f"Error fetching balance from {self.exchange_name}: {e}")
+            self.logger.error("Error fetching balance from %s: %s", self.exchange_name, e)
             return 0.0
     
+    def amount_to_precision(self, symbol: str, quote: str, amount: float) -> float:
+        """
+        Round an order amount down to the market's amount step
+        
+        ccxt does the rounding in decimal string arithmetic, so the result sits
+        exactly on the exchange's grid instead of carrying float noise.
+        
+        Args:
+            symbol: Base currency (e.g., 'XLM')
+            quote: Quote currency (e.g., 'USDT', 'USD')
+            amount: Amount of base currency
+        
+        Returns:
+            Rounded amount, or the amount unchanged if the pair is not listed
+        
+        Raises:
+            ccxt.InvalidOrder: If the amount rounds down to zero
+        """
+        pair = self._format_pair(symbol, quote)
+        if not pair:
+            return amount
+        return float(self.exchange.amount_to_precision(pair, amount))
+    
     def place_market_order(self, symbol: str, quote: str, side: str, amount: float) -> Optional[Dict]:
         """
         Place a market order
@@ -155,7 +556,8 @@ class ExchangeClient:
         """
         try:
             if Config.DRY_RUN:
-                print(f"[DRY RUN] Would place {side} order: {amount} {symbol} on {self.exchange_name}")
+                self.logger.info("[DRY RUN] Would place %s order: %s %s on %s",
+                                 side, amount, symbol, self.exchange_name)
                 return {
                     'id': 'dry_run_order',
                     'symbol': f"{symbol}/{quote}",
@@ -170,15 +572,62 @@ class ExchangeClient:
                 return None
             
             order = self.exchange.create_market_order(pair, side, amount)
-            print(f"✓ Order placed on {self.exchange_name}: {side} {amount} {symbol}")
+            self._balances_fetched_at = None  # The fill changed the balances
+            self.logger.info("✓ Order placed on %s: %s %s %s", self.exchange_name, side, amount, symbol)
+            
+            return order
+            
+        except ccxt.InsufficientFunds as e:
+            self.logger.error("✗ Insufficient funds on %s: %s", self.exchange_name, e)
+            return None
+        except Exception as e:
+            self.logger.error("✗ Error placing order on %s: %s", self.exchange_name, e)
+            return None
+    
+    async def place_market_order_async(self, symbol: str, quote: str, side: str,
+                                       amount: float) -> Optional[Dict]:
+        """
+        Async variant of place_market_order, so both legs of a trade can be sent at once
+        
+        Args:
+            symbol: Base currency (e.g., 'XLM')
+            quote: Quote currency (e.g., 'USDT', 'USD')
+            side: 'buy' or 'sell'
+            amount: Amount of base currency
+        
+        Returns:
+            Order information or None if error
+        """
+        try:
+            if Config.DRY_RUN:
+                self.logger.info("[DRY RUN] Would place %s order: %s %s on %s",
+                                 side, amount, symbol, self.exchange_name)
+                return {
+                    'id': 'dry_run_order',
+                    'symbol': f"{symbol}/{quote}",
+                    'type': 'market',
+                    'side': side,
+                    'amount': amount,
+                    'status': 'closed'
+                }
+            
+            pair = self._format_pair(symbol, quote)
+            if not pair:
+                return None
+            
+            async with self._order_semaphore:
+                await self._throttle('order')
+                order = await self.async_exchange.create_market_order(pair, side, amount)
+            self._balances_fetched_at = None  # The fill changed the balances
+            self.logger.info("✓ Order placed on %s: %s %s %s", self.exchange_name, side, amount, symbol)
             
             return order
             
         except ccxt.InsufficientFunds as e:
-            print(f"✗ Insufficient funds on {self.exchange_name}: {e}")
+            self.logger.error("✗ Insufficient funds on %s: %s", self.exchange_name, e)
             return None
         except Exception as e:
-            print(f"✗ Error placing order on {self.exchange_name}: {e}")
+            self.logger.error("✗ Error placing order on %s: %s", self.exchange_name, e)
             return None
     
     def get_trading_fees(self, symbol: str, quote: str) -> Tuple[float, float]:
@@ -188,6 +637,12 @@ class ExchangeClient:
         Returns:
             Tuple of (maker_fee, taker_fee) as percentages
         """
+        key = (symbol, quote)
+        cached = self._fee_cache.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[2] < self.FEE_CACHE_TTL_SECONDS:
+            return cached[:2]
+        
         try:
             pair = self._format_pair(symbol, quote)
             if not pair:
@@ -198,23 +653,51 @@ class ExchangeClient:
             maker = market.get('maker', 0.001) * 100  # Convert to percentage
             taker = market.get('taker', 0.001) * 100
             
+            self._fee_cache[key] = (maker, taker, now)
             return (maker, taker)
             
         except Exception as e:
-            print(f"Error getting fees from {self.exchange_name}: {e}")
+            self.logger.error("Error getting fees from %s: %s", self.exchange_name, e)
             return (0.1, 0.1)  # Default 0.1% fees
-
-
-class BinanceClient(ExchangeClient):
-    """Binance-specific client"""
     
-    def __init__(self):
-        super().__init__('binance')
+    async def open(self):
+        """
+        Give the async client a long-lived keep-alive HTTP session
+        
+        Must run inside the event loop before the first async request. The
+        session is reused for every call and only closed by close(), so
+        REST calls don't pay a fresh TCP/TLS handshake.
+        """
+        if self.async_exchange.session is not None:
+            return
+        
+        connector = aiohttp.TCPConnector(
+            ssl=ssl.create_default_context(cafile=certifi.where()),
+            limit_per_host=8,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True
+        )
+        # ccxt still owns the session and closes it in close()
+        self.async_exchange.session = aiohttp.ClientSession(connector=connector)
+    
+    async def close(self):
+        """Release the sync and async clients' HTTP sessions"""
+        if self.exchange is not None:
+            self.exchange.session.close()
+        if self.async_exchange is not None:
+            await self.async_exchange.close()
 
 
-class KrakenClient(ExchangeClient):
-    """Kraken-specific client"""
+def make_client(exchange_name: str) -> ExchangeClient:
+    """
+    Create and connect the client for an exchange
+    
+    Args:
+        exchange_name: One of the supported exchanges ('binance', 'kraken')
     
-    def __init__(self):
-        super().__init__('kraken')
+    Returns:
+        Connected ExchangeClient
+    """
+    return ExchangeClient(exchange_name)
 
@@ -1,11 +1,46 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 from datetime import datetime
 from colorama import init, Fore, Style
 
 # Initialize colorama for cross-platform colored output
 init(autoreset=True)
 
+# Background listeners doing the actual console/file I/O, per logger name
+_listeners = {}
+
+# Log file size before it is rotated, and how many rotated files to keep
+LOG_FILE_MAX_BYTES = 10 * 1024 * 1024
+LOG_FILE_BACKUP_COUNT = 5
+
+
+def _stop_listeners():
+    """Flush whatever is still queued on interpreter exit"""
+    while _listeners:
+        _, listener = _listeners.popitem()
+        listener.stop()
+
+
+atexit.register(_stop_listeners)
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that enqueues records unformatted
+    
+    The stock prepare() renders the message (getMessage, %-interpolation,
+    the arguments' __str__) on the logging thread. Passing the record through
+    as is leaves all of that to the listener thread. Arguments must therefore
+    not be mutated after the call; the bot only logs numbers, strings,
+    exceptions and frozen dataclasses.
+    """
+    
+    def prepare(self, record):
+        return record
+
 
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with colors for console output"""
@@ -18,16 +53,28 @@ class ColoredFormatter(logging.Formatter):
         'CRITICAL': Fore.RED + Style.BRIGHT,
     }
     
+    # Level names wrapped in their color codes, built once
+    DECORATED = {level: f"{color}{level}{Style.RESET_ALL}" for level, color in COLORS.items()}
+    
     def format(self, record):
-        log_color = self.COLORS.get(record.levelname, '')
-        record.levelname = f"{log_color}{record.levelname}{Style.RESET_ALL}"
-        return super().format(record)
+        # The same record is handed to the file handler next, so the colored
+        # name must not outlive this call
+        levelname = record.levelname
+        record.levelname = self.DECORATED.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 
 def setup_logger(name: str = 'arbitrage_bot', log_to_file: bool = True) -> logging.Logger:
     """
     Set up logger with console and file handlers
     
+    Records are put on an in-memory queue unformatted; a background
+    QueueListener thread does the message formatting and console/file writes
+    so the trading loop never blocks on log I/O.
+    
     Args:
         name: Logger name
         log_to_file: Whether to log to file
@@ -40,6 +87,10 @@ def setup_logger(name: str = 'arbitrage_bot', log_to_file: bool = True) -> loggi
     
     # Remove existing handlers
     logger.handlers = []
+    if name in _listeners:
+        _listeners.pop(name).stop()
+    
+    handlers = []
     
     # Console handler with colors
     console_handler = logging.StreamHandler()
@@ -49,26 +100,40 @@ def setup_logger(name: str = 'arbitrage_bot', log_to_file: bool = True) -> loggi
         datefmt='%H:%M:%S'
     )
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+    handlers.append(console_handler)
     
     # File handler
     if log_to_file:
-        if not os.path.exists('logs'):
-            os.makedirs('logs')
+        os.makedirs('logs', exist_ok=True)
         
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         log_filename = f'logs/arbitrage_bot_{timestamp}.log'
         
-        file_handler = logging.FileHandler(log_filename)
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_filename,
+            maxBytes=LOG_FILE_MAX_BYTES,
+            backupCount=LOG_FILE_BACKUP_COUNT,
+            delay=True  # Don't create the file until something is logged
+        )
         file_handler.setLevel(logging.DEBUG)
         file_formatter = logging.Formatter(
             '%(asctime)s | %(levelname)s | %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
-        
-        logger.info(f"Logging to file: {log_filename}")
+        # Console-only notices (like the one below) must not open the file
+        file_handler.addFilter(lambda record: not getattr(record, 'console_only', False))
+        handlers.append(file_handler)
+    
+    log_queue = queue.Queue(-1)
+    logger.addHandler(DeferredQueueHandler(log_queue))
+    
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners[name] = listener
+    
+    if log_to_file:
+        logger.info("Logging to file: %s", log_filename, extra={'console_only': True})
     
     return logger
 
@@ -0,0 +1,20 @@
+"""
+Market data types shared by the exchange clients, price feeds and detector
+Kept free of third-party imports so the detector can use them without ccxt
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(slots=True, frozen=True)
+class Ticker:
+    """Top-of-book snapshot for one market on one exchange"""
+    
+    exchange: str
+    symbol: str
+    bid: Optional[float]  # Highest buy price
+    ask: Optional[float]  # Lowest sell price
+    last: Optional[float]
+    timestamp: Optional[int]
+    datetime: Optional[str]
@@ -0,0 +1,210 @@
+"""
+WebSocket price feeds for Binance.US and Kraken
+Keep an in-memory best bid/ask per symbol, updated from exchange push streams
+"""
+
+import asyncio
+import json
+import time
+from typing import Dict, Optional, Tuple
+
+import websockets
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; fall back to the stdlib decoder
+    from json import loads as json_loads
+
+from exchange_client import ExchangeClient
+from models import Ticker
+
+
+class WSPriceFeed:
+    """Base class for push-based best bid/ask feeds"""
+    
+    RECONNECT_DELAY_SECONDS = 5
+    
+    def __init__(self, client: ExchangeClient, symbols: list, quotes: list,
+                 max_age_ms: int = 5000):
+        """
+        Args:
+            client: Connected exchange client, used to resolve trading pairs
+            symbols: Base currencies to subscribe to (e.g., ['XLM', 'XRP'])
+            quotes: Quote currencies in priority order (e.g., ['USDT', 'USD'])
+            max_age_ms: Cached quotes older than this are treated as missing
+        """
+        self.exchange_name = client.exchange_name
+        self.logger = client.logger
+        self.connected = False
+        self.max_age = max_age_ms / 1000
+        
+        # Latest ticker per base symbol, replaced (never mutated) on each frame
+        self.best: Dict[str, Ticker] = {}
+        
+        # Local monotonic receive time of each cached ticker
+        self.received_at: Dict[str, float] = {}
+        
+        # Exchange stream name -> (base symbol, unified pair)
+        self.streams: Dict[str, Tuple[str, str]] = {
+            self._stream_name(market): (symbol, market['symbol'])
+            for symbol, market in client.preferred_markets(symbols, quotes).items()
+        }
+    
+    @property
+    def url(self) -> str:
+        """WebSocket endpoint to connect to"""
+        raise NotImplementedError
+    
+    def _stream_name(self, market: Dict) -> str:
+        """Exchange-specific stream name for a ccxt market"""
+        raise NotImplementedError
+    
+    async def _subscribe(self, ws):
+        """Send subscription messages after connecting (if the exchange needs them)"""
+    
+    def _handle_message(self, message):
+        """Update the cache from a decoded frame"""
+        raise NotImplementedError
+    
+    def _update(self, stream: str, bid: float, ask: float, timestamp: int):
+        """Store a new best bid/ask for a stream"""
+        entry = self.streams.get(stream)
+        if entry is None:
+            return
+        
+        symbol, pair = entry
+        self.best[symbol] = Ticker(
+            self.exchange_name,
+            pair,
+            bid,
+            ask,
+            None,  # Book streams carry no trade price
+            timestamp,
+            None
+        )
+        self.received_at[symbol] = time.monotonic()
+    
+    def get_ticker(self, symbol: str) -> Optional[Ticker]:
+        """
+        Get the latest cached ticker for a symbol
+        
+        Args:
+            symbol: Base currency (e.g., 'XLM')
+        
+        Returns:
+            Ticker or None if the feed has no live data or the
+            cached quote is older than max_age_ms
+        """
+        if not self.connected:
+            return None
+        
+        received_at = self.received_at.get(symbol)
+        if received_at is None or time.monotonic() - received_at > self.max_age:
+            return None
+        return self.best.get(symbol)
+    
+    async def run(self):
+        """Connect and keep the cache up to date, reconnecting on failure"""
+        if not self.streams:
+            return
+        
+        while True:
+            try:
+                async with websockets.connect(self.url) as ws:
+                    await self._subscribe(ws)
+                    self.connected = True
+                    self.logger.info("✓ WebSocket feed connected to %s", self.exchange_name)
+                    
+                    async for message in ws:
+                        self._handle_message(json_loads(message))
+            
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.warning("WebSocket error on %s: %s", self.exchange_name, e)
+            finally:
+                # Stale quotes are worse than none; REST takes over until reconnect
+                self.connected = False
+                self.best.clear()
+                self.received_at.clear()
+            
+            await asyncio.sleep(self.RECONNECT_DELAY_SECONDS)
+
+
+class BinancePriceFeed(WSPriceFeed):
+    """Binance.US bookTicker feed"""
+    
+    @property
+    def url(self) -> str:
+        streams = '/'.join(f"{stream}@bookTicker" for stream in self.streams)
+        return f"wss://stream.binance.us:9443/stream?streams={streams}"
+    
+    def _stream_name(self, market: Dict) -> str:
+        return market['id'].lower()
+    
+    def _handle_message(self, message):
+        data = message.get('data')
+        if not data:
+            return
+        
+        self._update(
+            data['s'].lower(),
+            float(data['b']),
+            float(data['a']),
+            int(time.time() * 1000)
+        )
+
+
+class KrakenPriceFeed(WSPriceFeed):
+    """Kraken spread feed"""
+    
+    @property
+    def url(self) -> str:
+        return "wss://ws.kraken.com"
+    
+    def _stream_name(self, market: Dict) -> str:
+        return market['info'].get('wsname', market['symbol'])
+    
+    async def _subscribe(self, ws):
+        await ws.send(json.dumps({
+            'event': 'subscribe',
+            'pair': list(self.streams),
+            'subscription': {'name': 'spread'}
+        }))
+    
+    def _handle_message(self, message):
+        # Events (heartbeat, status) are dicts; data frames are lists:
+        # [channelID, [bid, ask, timestamp, bidVolume, askVolume], 'spread', pair]
+        if isinstance(message, dict):
+            if message.get('status') == 'error':
+                self.logger.error("WebSocket subscription error on %s: %s",
+                                  self.exchange_name, message.get('errorMessage'))
+            return
+        
+        spread = message[1]
+        self._update(
+            message[-1],
+            float(spread[0]),
+            float(spread[1]),
+            int(float(spread[2]) * 1000)
+        )
+
+
+FEEDS = {
+    'binance': BinancePriceFeed,
+    'kraken': KrakenPriceFeed,
+}
+
+
+def create_price_feed(client: ExchangeClient, symbols: list, quotes: list,
+                      max_age_ms: int = 5000) -> Optional[WSPriceFeed]:
+    """
+    Create the WebSocket feed for an exchange client
+    
+    Returns:
+        WSPriceFeed instance or None if the exchange has no feed implementation
+    """
+    feed_class = FEEDS.get(client.exchange_name)
+    if feed_class is None:
+        return None
+    return feed_class(client, symbols, quotes, max_age_ms)
@@ -0,0 +1,46 @@
+"""
+Token-bucket rate limiting for exchange REST requests
+Lets concurrent requests burst up to an exchange's budget instead of spacing every call
+"""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Async token bucket holding up to capacity tokens, refilled at rate tokens per second"""
+    
+    def __init__(self, capacity: float, rate: float):
+        """
+        Args:
+            capacity: Maximum burst, in request weight
+            rate: Sustained request weight allowed per second
+        """
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        
+        # Waiters are served in arrival order
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self, weight: float = 1):
+        """
+        Wait until weight tokens are available and take them
+        
+        Args:
+            weight: Cost of the request; capped at capacity so it can always be served
+        """
+        weight = min(weight, self.capacity)
+        
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                
+                if self.tokens >= weight:
+                    self.tokens -= weight
+                    return
+                
+                await asyncio.sleep((weight - self.tokens) / self.rate)